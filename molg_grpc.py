@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Optional gRPC transport for the joint-position streaming path.
+
+The JSON-over-HTTP client in molg_robot_api.py pays a fresh request plus
+JSON encode/decode for every send_joint_positions/get_hardware_state call.
+This module streams the same data over a single gRPC channel instead, which
+amortizes the handshake and replaces JSON with protobuf on the hot path.
+
+Requires grpcio and the stubs generated from protos/molg_station.proto:
+
+    python -m grpc_tools.protoc -Iprotos --python_out=. --grpc_python_out=. protos/molg_station.proto
+
+The station must expose the MolgStation gRPC service; the default
+JSON-over-HTTP API in MolgStationAPI remains the fallback.
+"""
+import logging
+from typing import Iterable, Iterator
+
+import numpy as np
+
+LOG = logging.getLogger(__name__)
+
+GRPC_PORT = 9306
+
+
+class MolgStationGRPC:
+    def __init__(self, host: str = "localhost", port: int = GRPC_PORT):
+        """
+        Opens a single gRPC channel to the station and builds the stub.
+
+        Args:
+            host (str): The station host.
+            port (int): The gRPC service port.
+
+        Raises:
+            ImportError: If grpcio or the generated stubs are unavailable.
+        """
+        try:
+            import grpc
+            import molg_station_pb2
+            import molg_station_pb2_grpc
+        except ImportError as e:
+            raise ImportError(
+                "MolgStationGRPC requires grpcio and the generated stubs; see "
+                "protos/molg_station.proto for the protoc command."
+            ) from e
+        self._pb2 = molg_station_pb2
+        self._channel = grpc.insecure_channel(f"{host}:{port}")
+        self._stub = molg_station_pb2_grpc.MolgStationStub(self._channel)
+        LOG.debug("MolgStationGRPC connected to %s:%d", host, port)
+
+    def send_joint_positions(self, targets: Iterable[np.ndarray], step_count: int = 1) -> Iterator[bool]:
+        """
+        Streams joint-position targets to the robot over one RPC.
+
+        Args:
+            targets (Iterable[np.ndarray]): The joint-position vectors to send.
+            step_count (int): The number of steps for each movement.
+
+        Yields:
+            bool: Whether each target was accepted.
+        """
+        requests = (
+            self._pb2.JointVec(q=joint_positions.tolist(), step_count=step_count)
+            for joint_positions in targets
+        )
+        for ack in self._stub.SendJointPositions(requests):
+            yield ack.accepted
+
+    def get_hardware_state(self) -> Iterator[np.ndarray]:
+        """
+        Streams hardware-state updates from the robot.
+
+        Yields:
+            np.ndarray: The joint positions of each state update.
+        """
+        for state in self._stub.GetHardwareState(self._pb2.Empty()):
+            yield np.asarray(state.joint_positions, dtype=np.float64)
+
+    def close(self) -> None:
+        """
+        Closes the underlying gRPC channel.
+        """
+        self._channel.close()
+        LOG.debug("MolgStationGRPC channel closed.")
@@ -1,14 +1,85 @@
 #!/usr/bin/env python3
+import asyncio
 import logging
+import socket
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional
 
+import httpx
 import numpy as np
+import orjson
 import requests  # Added for HTTP requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from micropsi_integration_sdk import JointPositionRobot, HardwareState
 
 LOG = logging.getLogger(__name__)
 
+# Result of a fused control-loop step; see MolgStationAPI.step().
+StepResult = namedtuple("StepResult", ["state", "safe", "accepted"])
+
+
+class _LowLatencyAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that disables Nagle and enables TCP keep-alive on its pool.
+
+    The default socket options leave Nagle enabled, which can hold the small
+    JSON payloads of control traffic behind delayed ACKs for tens of
+    milliseconds per request.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Shared across MolgStationAPI instances so a process orchestrating N robots
+# reuses one connection pool instead of owning one pool per instance.
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.mount("http://", _LowLatencyAdapter(
+    pool_connections=256,
+    pool_maxsize=512,
+    max_retries=Retry(total=2, backoff_factor=0),
+))
+_SHARED_SESSION.headers.update({
+    "Connection": "keep-alive",
+    "Content-Type": "application/json",
+})
+
+# Shared async clients, keyed per running event loop: pooled connections are
+# bound to the loop that created them, so per-call asyncio.run wrappers (each
+# of which runs a fresh loop) must not reuse another loop's client.
+_SHARED_ASYNC_CLIENTS = {}
+
+
+def _shared_async_client() -> httpx.AsyncClient:
+    """
+    Returns the httpx.AsyncClient shared by MolgStationAPIAsync instances on
+    the running event loop, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    client = _SHARED_ASYNC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        # Drop entries whose loops have since closed; their pooled connections
+        # are unusable and are reclaimed with the client objects.
+        for stale in [l for l in _SHARED_ASYNC_CLIENTS if l.is_closed()]:
+            del _SHARED_ASYNC_CLIENTS[stale]
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            headers={"Content-Type": "application/json"},
+        )
+        _SHARED_ASYNC_CLIENTS[loop] = client
+    return client
+
 
 class MolgStationAPI(JointPositionRobot):
     def __init__(self, **kwargs):
@@ -20,25 +91,81 @@ class MolgStationAPI(JointPositionRobot):
         """
         self.__host = kwargs.pop("host", "localhost")
         self.__port = kwargs.pop("port", 9305)
+        session = kwargs.pop("session", None)
+        urdf_path = kwargs.pop("urdf_path", None)
         super().__init__(**kwargs)
+        # Optional local kinematics model; when present, forward/inverse
+        # kinematics are computed in-process instead of round-tripping to the
+        # server.
+        self._local_chain = None
+        self._active_idx = None
+        if urdf_path is not None:
+            try:
+                from ikpy.chain import Chain
+                self._local_chain = Chain.from_urdf_file(urdf_path)
+                self._active_idx = np.flatnonzero(self._local_chain.active_links_mask)
+                LOG.debug("Loaded local kinematics model from %s", urdf_path)
+            except ImportError:
+                LOG.warning("urdf_path given but ikpy is not installed; "
+                            "falling back to server-side kinematics.")
+        self._fk_cache_q = None
+        self._fk_cache_pose = None
+        self._fk_eps = 1e-9
+        # Endpoint names are compile-time constants; bake the URLs once so the
+        # hot path does a dict lookup instead of an f-string per request.
+        self._urls = {
+            name: f"http://{self.__host}:{self.__port}/{name}"
+            for name in (
+                "connect", "disconnect", "get_hardware_state", "send_joint_positions",
+                "command_move", "command_stop", "forward_kinematics", "inverse_kinematics",
+                "are_joint_positions_safe", "step", "forward_kinematics_batch",
+                "forward_kinematics_bin",
+                "are_joint_positions_safe_batch", "get_joint_count",
+                "get_joint_speed_limits", "get_joint_position_limits",
+                "prepare_for_control", "take_control", "release_control",
+                "clear_cached_hardware_state",
+            )
+        }
         self.__joint_positions = np.zeros(6)  # Assuming a 6-DOF robot
+        # Scratch buffer for hardware-state parsing; filled in place each tick
+        # so the hot loop avoids a fresh np.array(list) allocation per call.
+        self._hw_q = np.empty(6, dtype=np.float64)
+        self.__session = session if session is not None else _SHARED_SESSION
+        # Runs posts whose responses the caller never reads (release_control,
+        # clear_cached_hardware_state) off the critical path.
+        self._bg = ThreadPoolExecutor(max_workers=1)
+        self._last_bg_future = None
         self.__connected = False
         self.__ready_for_control = False
         self.__controlled = False
+        # Session-constant values; cached on first query and invalidated on disconnect.
+        self._joint_count = None
+        self._speed_limits = None
+        self._position_limits = None
+        # Last commanded target; lets send_joint_positions skip the round-trip
+        # when a streaming caller repeats an identical frame.
+        self._last_sent_q = None
+        self._last_step_count = None
+        self._send_eps = 1e-6
         LOG.debug("MolgStationAPI initialized with host=%s, port=%d", self.__host, self.__port)
 
     def _build_url(self, method_name: str) -> str:
         """
-        Constructs the endpoint URL for a given method.
+        Returns the endpoint URL for a given method.
+
+        Known endpoints are pre-baked in __init__; unknown ones are built and
+        cached on first use.
 
         Args:
             method_name (str): The name of the method.
 
         Returns:
-            str: The constructed URL.
+            str: The endpoint URL.
         """
-        url = f"http://{self.__host}:{self.__port}/{method_name}"
-        LOG.debug("Built URL: %s", url)
+        url = self._urls.get(method_name)
+        if url is None:
+            url = f"http://{self.__host}:{self.__port}/{method_name}"
+            self._urls[method_name] = url
         return url
 
     def POST(self, method_name: str, headers: Optional[dict] = None, params: Optional[dict] = None, payload: Optional[dict] = None) -> Optional[dict]:
@@ -55,11 +182,45 @@ class MolgStationAPI(JointPositionRobot):
             dict: The JSON response from the server.
         """
         url = self._build_url(method_name)
-        LOG.debug("Performing POST request to %s with payload: %s", url, payload)
-        response = requests.post(url, headers=headers, params=params, json=payload)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Performing POST request to %s with payload: %s", url, payload)
+        data = None
+        if payload is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+            # Injected sessions may lack the shared session's default headers,
+            # so label the body explicitly.
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        response = self.__session.post(url, headers=headers, params=params, data=data)
         response.raise_for_status()
-        LOG.debug("POST response: %s", response.json())
-        return response.json()
+        result = orjson.loads(response.content)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("POST response: %s", result)
+        return result
+
+    def POST_fireforget(self, method_name: str, payload: Optional[dict] = None) -> None:
+        """
+        Performs a POST request and returns as soon as the status line arrives.
+
+        Skips response parsing entirely; used on latency-critical paths such
+        as command_stop, where the caller has no use for the response body.
+
+        Args:
+            method_name (str): The API method name.
+            payload (dict, optional): JSON payload.
+        """
+        url = self._build_url(method_name)
+        data = None
+        headers = None
+        if payload is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+            headers = {"Content-Type": "application/json"}
+        # No connect timeout: on an emergency-stop path a slow send beats no
+        # send, and a cold or dropped connection must not abort the stop.
+        response = self.__session.post(url, headers=headers, data=data, stream=True)
+        try:
+            response.raise_for_status()
+        finally:
+            response.close()
 
     def GET(self, method_name: str, headers: Optional[dict] = None, params: Optional[dict] = None) -> Optional[dict]:
         """
@@ -75,10 +236,12 @@ class MolgStationAPI(JointPositionRobot):
         """
         url = self._build_url(method_name)
         LOG.debug("Performing GET request to %s", url)
-        response = requests.get(url, headers=headers, params=params)
+        response = self.__session.get(url, headers=headers, params=params)
         response.raise_for_status()
-        LOG.debug("GET response: %s", response.json())
-        return response.json()
+        result = orjson.loads(response.content)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("GET response: %s", result)
+        return result
 
     @staticmethod
     def get_supported_models() -> list:
@@ -97,40 +260,52 @@ class MolgStationAPI(JointPositionRobot):
         """
         Retrieves the number of joints in the robot.
 
+        The value is cached after the first query and invalidated on disconnect.
+
         Returns:
             int: The number of joints.
         """
+        if self._joint_count is not None:
+            return self._joint_count
         LOG.debug("Getting joint count.")
         response = self.GET("get_joint_count")
-        joint_count = response.get("joint_count", 0)
-        LOG.debug("Joint count: %d", joint_count)
-        return joint_count
+        self._joint_count = response.get("joint_count", 0)
+        LOG.debug("Joint count: %d", self._joint_count)
+        return self._joint_count
 
     def get_joint_speed_limits(self) -> np.array:
         """
         Retrieves the speed limits for each joint.
 
+        The value is cached after the first query and invalidated on disconnect.
+
         Returns:
             np.array: An array of speed limits.
         """
+        if self._speed_limits is not None:
+            return self._speed_limits
         LOG.debug("Getting joint speed limits.")
         response = self.GET("get_joint_speed_limits")
-        limits = np.array(response.get("limits", [])) if response else np.array([])
-        LOG.debug("Joint speed limits: %s", limits)
-        return limits
+        self._speed_limits = np.asarray(response.get("limits", []), dtype=np.float64) if response else np.array([])
+        LOG.debug("Joint speed limits: %s", self._speed_limits)
+        return self._speed_limits
 
     def get_joint_position_limits(self) -> np.array:
         """
         Retrieves the position limits for each joint.
 
+        The value is cached after the first query and invalidated on disconnect.
+
         Returns:
             np.array: An array of position limits.
         """
+        if self._position_limits is not None:
+            return self._position_limits
         LOG.debug("Getting joint position limits.")
         response = self.GET("get_joint_position_limits")
-        limits = np.array(response.get("limits", [])) if response else np.array([])
-        LOG.debug("Joint position limits: %s", limits)
-        return limits
+        self._position_limits = np.asarray(response.get("limits", []), dtype=np.float64) if response else np.array([])
+        LOG.debug("Joint position limits: %s", self._position_limits)
+        return self._position_limits
 
     def connect(self) -> bool:
         """
@@ -145,6 +320,25 @@ class MolgStationAPI(JointPositionRobot):
         LOG.debug("Connected: %s", self.__connected)
         return self.__connected
 
+    def startup(self) -> None:
+        """
+        Warms the session-constant caches concurrently.
+
+        get_joint_count, get_joint_speed_limits and get_joint_position_limits
+        each cost a round-trip; issuing them at once on pooled connections
+        collapses three serial round-trips into roughly one wall-clock one.
+        """
+        LOG.debug("Warming session caches.")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.get_joint_count),
+                executor.submit(self.get_joint_speed_limits),
+                executor.submit(self.get_joint_position_limits),
+            ]
+            for future in futures:
+                future.result()
+        LOG.debug("Session caches warmed.")
+
     def disconnect(self) -> None:
         """
         Disconnects from the robot.
@@ -152,13 +346,31 @@ class MolgStationAPI(JointPositionRobot):
         LOG.debug("Disconnecting from the robot.")
         response = self.POST("disconnect")
         self.__connected = response.get("connected", False)
+        self._joint_count = None
+        self._speed_limits = None
+        self._position_limits = None
+        self._last_sent_q = None
+        self._last_step_count = None
         LOG.debug("Disconnected: %s", not self.__connected)
 
+    def close(self) -> None:
+        """
+        Disconnects from the robot and closes the underlying HTTP session.
+        """
+        LOG.debug("Closing the API client.")
+        self._bg.shutdown(wait=True)
+        if self.__connected:
+            self.disconnect()
+        if self.__session is not _SHARED_SESSION:
+            self.__session.close()
+        LOG.debug("API client closed.")
+
     def prepare_for_control(self) -> None:
         """
         Prepares the robot for control.
         """
         LOG.debug("Preparing robot for control.")
+        self._drain_bg()
         response = self.POST("prepare_for_control")
         self.__ready_for_control = response.get("ready_for_control", False)
         LOG.debug("Ready for control: %s", self.__ready_for_control)
@@ -174,11 +386,55 @@ class MolgStationAPI(JointPositionRobot):
         LOG.debug("Ready for control: %s", self.__ready_for_control)
         return self.__ready_for_control
 
+    @staticmethod
+    def _log_bg_failure(method_name: str, future) -> None:
+        """
+        Logs the exception of a failed background request, if any.
+
+        Args:
+            method_name (str): The API method name the request targeted.
+            future: The completed future.
+        """
+        exception = future.exception()
+        if exception is not None:
+            LOG.error("Background %s request failed: %s", method_name, exception)
+
+    def _submit_bg(self, method_name: str) -> None:
+        """
+        Submits a POST to the background executor.
+
+        The caller does not wait for the response; failures are logged when
+        the future completes so they are not silently swallowed.
+
+        Args:
+            method_name (str): The API method name.
+        """
+        future = self._bg.submit(self.POST, method_name)
+        future.add_done_callback(partial(self._log_bg_failure, method_name))
+        self._last_bg_future = future
+
+    def _drain_bg(self) -> None:
+        """
+        Waits for pending background requests to finish.
+
+        Calls that must observe the effect of a previously backgrounded
+        request (e.g. take_control after release_control, or
+        get_hardware_state after clear_cached_hardware_state) drain the
+        single-worker queue first so requests reach the server in order.
+        """
+        future = self._last_bg_future
+        if future is not None:
+            # exception() blocks until done without re-raising; failures were
+            # already logged by the done-callback.
+            future.exception()
+            self._last_bg_future = None
+
     def take_control(self) -> None:
         """
         Takes control of the robot.
         """
         LOG.debug("Taking control of the robot.")
+        self._drain_bg()
         response = self.POST("take_control")
         self.__controlled = response.get("controlled", False)
         LOG.debug("Control taken: %s", self.__controlled)
@@ -186,27 +442,60 @@ class MolgStationAPI(JointPositionRobot):
     def release_control(self) -> None:
         """
         Releases control of the robot.
+
+        The request is dispatched in the background; the caller does not wait
+        for the server response.
         """
         LOG.debug("Releasing control of the robot.")
-        self.POST("release_control")
+        self._submit_bg("release_control")
         self.__controlled = False
         self.__ready_for_control = False
+        # A control handoff invalidates the dedup state: the arm may be moved
+        # while released, so a repeated target must reach the robot afterwards.
+        self._last_sent_q = None
+        self._last_step_count = None
         LOG.debug("Control released.")
 
+    def _parse_joint_positions(self, values) -> np.ndarray:
+        """
+        Builds a joint-position vector from a decoded response list.
+
+        Fills the preallocated scratch buffer with a single typed copy instead
+        of boxing each element through np.array(list), then hands back a copy
+        the caller may keep.
+
+        Args:
+            values: The decoded joint positions, or None.
+
+        Returns:
+            np.ndarray: The joint positions.
+        """
+        if values is None:
+            return self.__joint_positions.copy()
+        if len(values) == len(self._hw_q):
+            self._hw_q[:] = values
+            return self._hw_q.copy()
+        return np.asarray(values, dtype=np.float64)
+
     def get_hardware_state(self) -> Optional[HardwareState]:
         """
         Retrieves the current hardware state of the robot.
 
+        In control loops, prefer step(), which fuses state query, safety check
+        and command into one round-trip.
+
         Returns:
             HardwareState: The hardware state object.
         """
         LOG.debug("Getting hardware state.")
+        self._drain_bg()
         response = self.GET("get_hardware_state")
         if response:
             state = HardwareState(
-                joint_positions=np.array(response.get("joint_positions", self.__joint_positions)),
+                joint_positions=self._parse_joint_positions(response.get("joint_positions")),
             )
-            LOG.debug("Hardware state: %s", state)
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("Hardware state: %s", state)
             return state
         LOG.debug("No hardware state available.")
         return None
@@ -214,15 +503,35 @@ class MolgStationAPI(JointPositionRobot):
     def clear_cached_hardware_state(self) -> None:
         """
         Clears the cached hardware state.
+
+        The request is dispatched in the background; the caller does not wait
+        for the server response.
         """
         LOG.debug("Clearing cached hardware state.")
-        self.POST("clear_cached_hardware_state")
+        self._submit_bg("clear_cached_hardware_state")
         LOG.debug("Cached hardware state cleared.")
 
+    def _full_joint_vector(self, joint_positions: np.ndarray) -> np.ndarray:
+        """
+        Expands actuated joint positions to the local chain's full link vector.
+
+        Args:
+            joint_positions (np.ndarray): Positions of the actuated joints.
+
+        Returns:
+            np.ndarray: A vector with one entry per chain link.
+        """
+        full = np.zeros(len(self._local_chain.links))
+        full[self._active_idx] = joint_positions
+        return full
+
     def forward_kinematics(self, *, joint_positions: np.array) -> np.array:
         """
         Computes the forward kinematics for the given joint positions.
 
+        Computed locally (with a last-configuration cache) when a model was
+        loaded via urdf_path; otherwise queried from the server.
+
         Args:
             joint_positions (np.array): The joint positions.
 
@@ -230,15 +539,81 @@ class MolgStationAPI(JointPositionRobot):
             np.array: The end-effector pose.
         """
         LOG.debug("Computing forward kinematics.")
-        response = self.POST("forward_kinematics", payload={"joint_positions": joint_positions.tolist()})
-        pose = np.array(response.get("end_effector_pose")) if response else None
+        if self._local_chain is not None:
+            if (self._fk_cache_q is not None
+                    and np.max(np.abs(joint_positions - self._fk_cache_q)) < self._fk_eps):
+                return self._fk_cache_pose.copy()
+            pose = np.asarray(
+                self._local_chain.forward_kinematics(self._full_joint_vector(joint_positions)),
+                dtype=np.float64,
+            )
+            self._fk_cache_q = joint_positions.copy()
+            self._fk_cache_pose = pose
+            return pose.copy()
+        response = self.POST("forward_kinematics", payload={"joint_positions": joint_positions})
+        pose = np.asarray(response.get("end_effector_pose"), dtype=np.float64) if response else None
         LOG.debug("Forward kinematics result: %s", pose)
         return pose
 
+    def batch_forward_kinematics(self, *, joint_positions_batch: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Computes forward kinematics for a batch of joint configurations.
+
+        Evaluating N candidates through forward_kinematics costs N round-trips;
+        this submits the whole batch in one request.
+
+        Args:
+            joint_positions_batch (np.ndarray): Joint positions of shape (N, joints).
+
+        Returns:
+            np.ndarray: The end-effector poses, one row per configuration.
+        """
+        LOG.debug("Computing batched forward kinematics.")
+        response = self.POST("forward_kinematics_batch", payload={"joint_positions": joint_positions_batch})
+        if not response:
+            return None
+        poses = np.asarray(response.get("end_effector_pose"), dtype=np.float64).reshape(len(joint_positions_batch), -1)
+        LOG.debug("Batched forward kinematics result: %s", poses)
+        return poses
+
+    def batch_forward_kinematics_bin(self, *, joint_positions_batch: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Computes batched forward kinematics over a raw-bytes payload.
+
+        Sends the (N, joints) batch as contiguous float64 bytes to the
+        'forward_kinematics_bin' endpoint instead of JSON, roughly quartering
+        the payload size and skipping per-element encode/decode on both sides.
+        The response body is the raw bytes of the poses, decoded with
+        np.frombuffer.
+
+        Args:
+            joint_positions_batch (np.ndarray): Joint positions of shape (N, joints).
+
+        Returns:
+            np.ndarray: The end-effector poses, one row per configuration.
+        """
+        LOG.debug("Computing batched forward kinematics over binary payload.")
+        batch = np.ascontiguousarray(joint_positions_batch, dtype=np.float64)
+        response = self.__session.post(
+            self._build_url("forward_kinematics_bin"),
+            data=batch.tobytes(order="C"),
+            headers={
+                "Content-Type": "application/octet-stream",
+                "X-Shape": f"{batch.shape[0]},{batch.shape[1]}",
+            },
+        )
+        response.raise_for_status()
+        if not response.content:
+            return None
+        return np.frombuffer(response.content, dtype=np.float64).reshape(len(batch), -1)
+
     def inverse_kinematics(self, *, end_effector_pose: np.ndarray, joint_reference: Optional[np.ndarray]) -> Optional[np.ndarray]:
         """
         Computes the inverse kinematics for the given end-effector pose.
 
+        Computed locally when a model was loaded via urdf_path; otherwise
+        queried from the server.
+
         Args:
             end_effector_pose (np.ndarray): The end-effector pose.
             joint_reference (np.ndarray, optional): A reference joint configuration.
@@ -247,11 +622,16 @@ class MolgStationAPI(JointPositionRobot):
             np.ndarray: The joint positions.
         """
         LOG.debug("Computing inverse kinematics.")
+        if self._local_chain is not None:
+            frame = np.asarray(end_effector_pose, dtype=np.float64).reshape(4, 4)
+            initial = self._full_joint_vector(joint_reference) if joint_reference is not None else None
+            full = self._local_chain.inverse_kinematics_frame(frame, initial_position=initial)
+            return np.asarray(full, dtype=np.float64)[self._active_idx]
         response = self.POST("inverse_kinematics", payload={
-            "end_effector_pose": end_effector_pose.tolist(),
-            "joint_reference": joint_reference.tolist() if joint_reference is not None else None
+            "end_effector_pose": end_effector_pose,
+            "joint_reference": joint_reference
         })
-        joint_positions = np.array(response.get("joint_positions")) if response else None
+        joint_positions = np.fromiter(response.get("joint_positions"), dtype=np.float64) if response else None
         LOG.debug("Inverse kinematics result: %s", joint_positions)
         return joint_positions
 
@@ -259,33 +639,109 @@ class MolgStationAPI(JointPositionRobot):
         """
         Checks if the given joint positions are safe.
 
+        In control loops, prefer step(), which fuses state query, safety check
+        and command into one round-trip.
+
         Args:
             joint_positions (np.ndarray): The joint positions.
 
         Returns:
             bool: True if safe, False otherwise.
         """
-        LOG.info("Checking if joint positions are safe.")
-        response = self.POST("are_joint_positions_safe", payload={"joint_positions": joint_positions.tolist()})
+        LOG.debug("Checking if joint positions are safe.")
+        response = self.POST("are_joint_positions_safe", payload={"joint_positions": joint_positions})
         safe = response.get("safe", False)
-        LOG.info("Joint positions safe: %s", safe)
+        LOG.debug("Joint positions safe: %s", safe)
+        return safe
+
+    def batch_are_joint_positions_safe(self, *, joint_positions_batch: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Checks a batch of joint configurations for safety in one round-trip.
+
+        Args:
+            joint_positions_batch (np.ndarray): Joint positions of shape (N, joints).
+
+        Returns:
+            np.ndarray: A boolean array, one entry per configuration.
+        """
+        LOG.debug("Checking batched joint positions for safety.")
+        response = self.POST("are_joint_positions_safe_batch", payload={"joint_positions": joint_positions_batch})
+        if not response:
+            return None
+        safe = np.asarray(response.get("safe", []), dtype=bool)
+        LOG.debug("Batched safety result: %s", safe)
         return safe
 
     def send_joint_positions(self, *, joint_positions: np.ndarray, step_count: int) -> None:
         """
         Sends joint positions to the robot.
 
+        In control loops, prefer step(), which fuses state query, safety check
+        and command into one round-trip.
+
         Args:
             joint_positions (np.ndarray): The joint positions.
             step_count (int): The number of steps for the movement.
         """
+        if (self._last_sent_q is not None
+                and step_count == self._last_step_count
+                and np.max(np.abs(joint_positions - self._last_sent_q)) < self._send_eps):
+            LOG.debug("Skipping send_joint_positions; target matches last commanded.")
+            return
         LOG.debug("Sending joint positions.")
         self.POST("send_joint_positions", payload={
-            "joint_positions": joint_positions.tolist(),
+            "joint_positions": joint_positions,
             "step_count": step_count
         })
+        self._last_sent_q = joint_positions.copy()
+        self._last_step_count = step_count
         # self.__joint_positions = np.copy(joint_positions)
-        LOG.debug("Joint positions sent: %s", joint_positions)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Joint positions sent: %s", joint_positions)
+
+    def step(self, *, joint_positions: np.ndarray, step_count: int) -> StepResult:
+        """
+        Performs one fused control-loop tick in a single round-trip.
+
+        Replaces the get_hardware_state -> are_joint_positions_safe ->
+        send_joint_positions sequence, which costs three round-trips per tick,
+        with one request to the 'step' endpoint.
+
+        Args:
+            joint_positions (np.ndarray): The target joint positions.
+            step_count (int): The number of steps for the movement.
+
+        Returns:
+            StepResult: The hardware state, whether the target was safe, and
+                whether the server accepted it.
+        """
+        LOG.debug("Performing fused control step.")
+        response = self.POST("step", payload={
+            "target": joint_positions,
+            "step_count": step_count,
+            "return_state": True,
+        })
+        state = None
+        if response and response.get("state") is not None:
+            state = HardwareState(
+                joint_positions=self._parse_joint_positions(response["state"].get("joint_positions")),
+            )
+        result = StepResult(
+            state=state,
+            safe=response.get("safe", False) if response else False,
+            accepted=response.get("accepted", False) if response else False,
+        )
+        # step() commands the arm too, so it owns the send dedup state: record
+        # the accepted target, or invalidate on rejection.
+        if result.accepted:
+            self._last_sent_q = joint_positions.copy()
+            self._last_step_count = step_count
+        else:
+            self._last_sent_q = None
+            self._last_step_count = None
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Step result: %s", result)
+        return result
 
     def command_move(self, *, joint_positions: np.array) -> None:
         """
@@ -294,15 +750,226 @@ class MolgStationAPI(JointPositionRobot):
         Args:
             joint_positions (np.array): The target joint positions.
         """
-        LOG.info("Commanding robot to move.")
-        self.POST("command_move", payload={"joint_positions": joint_positions.tolist()})
+        LOG.debug("Commanding robot to move.")
+        self.POST("command_move", payload={"joint_positions": joint_positions})
+        # The arm is heading somewhere new, so a repeated streaming target must
+        # reach the robot again.
+        self._last_sent_q = None
+        self._last_step_count = None
         # self.__joint_positions = np.copy(joint_positions)
-        LOG.info("Move command executed with joint positions: %s", joint_positions)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Move command executed with joint positions: %s", joint_positions)
 
     def command_stop(self) -> None:
         """
         Commands the robot to stop its current movement.
         """
         LOG.info("Commanding robot to stop.")
-        self.POST("command_stop")
+        self.POST_fireforget("command_stop")
+        # A stop invalidates the dedup state: resending the same target after
+        # a stop must reach the robot.
+        self._last_sent_q = None
+        self._last_step_count = None
         LOG.info("Stop command executed.")
+
+
+class MolgStationAPIAsync:
+    """
+    Async mirror of MolgStationAPI.
+
+    Uses a single httpx.AsyncClient with HTTP/2 so concurrent calls (multiple
+    robots, or state queries overlapping motion commands) multiplex over one
+    connection instead of serializing a full round-trip per call.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initializes the MolgStationAPIAsync instance.
+
+        Args:
+            **kwargs: Additional keyword arguments for configuration.
+        """
+        self._host = kwargs.pop("host", "localhost")
+        self._port = kwargs.pop("port", 9305)
+        # An injected client is owned (and closed) by this instance; otherwise
+        # each call lazily resolves the shared client of the running loop.
+        self._client = kwargs.pop("client", None)
+        self._joint_positions = np.zeros(6)  # Assuming a 6-DOF robot
+        self._connected = False
+        LOG.debug("MolgStationAPIAsync initialized with host=%s, port=%d", self._host, self._port)
+
+    def _build_url(self, method_name: str) -> str:
+        """
+        Constructs the endpoint URL for a given method.
+
+        Args:
+            method_name (str): The name of the method.
+
+        Returns:
+            str: The constructed URL.
+        """
+        return f"http://{self._host}:{self._port}/{method_name}"
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Returns the client to use: the injected one, or the shared client of
+        the running event loop.
+        """
+        return self._client if self._client is not None else _shared_async_client()
+
+    async def POST(self, method_name: str, headers: Optional[dict] = None, params: Optional[dict] = None, payload: Optional[dict] = None) -> Optional[dict]:
+        """
+        Performs an async POST request to the specified method.
+
+        Args:
+            method_name (str): The API method name.
+            headers (dict, optional): HTTP headers.
+            params (dict, optional): Query parameters.
+            payload (dict, optional): JSON payload.
+
+        Returns:
+            dict: The JSON response from the server.
+        """
+        url = self._build_url(method_name)
+        LOG.debug("Performing async POST request to %s with payload: %s", url, payload)
+        content = None
+        if payload is not None:
+            content = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+            # Injected clients may lack the shared client's default headers,
+            # so label the body explicitly.
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        response = await self._get_client().post(url, headers=headers, params=params, content=content)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def GET(self, method_name: str, headers: Optional[dict] = None, params: Optional[dict] = None) -> Optional[dict]:
+        """
+        Performs an async GET request to the specified method.
+
+        Args:
+            method_name (str): The API method name.
+            headers (dict, optional): HTTP headers.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            dict: The JSON response from the server.
+        """
+        url = self._build_url(method_name)
+        LOG.debug("Performing async GET request to %s", url)
+        response = await self._get_client().get(url, headers=headers, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def connect(self) -> bool:
+        """
+        Connects to the robot.
+
+        Returns:
+            bool: True if connected, False otherwise.
+        """
+        response = await self.POST("connect")
+        self._connected = response.get("connected", False)
+        return self._connected
+
+    async def disconnect(self) -> None:
+        """
+        Disconnects from the robot.
+        """
+        response = await self.POST("disconnect")
+        self._connected = response.get("connected", False)
+
+    async def get_hardware_state(self) -> Optional[HardwareState]:
+        """
+        Retrieves the current hardware state of the robot.
+
+        Returns:
+            HardwareState: The hardware state object.
+        """
+        response = await self.GET("get_hardware_state")
+        if response:
+            return HardwareState(
+                joint_positions=np.array(response.get("joint_positions", self._joint_positions)),
+            )
+        return None
+
+    async def are_joint_positions_safe(self, *, joint_positions: np.ndarray) -> bool:
+        """
+        Checks if the given joint positions are safe.
+
+        Args:
+            joint_positions (np.ndarray): The joint positions.
+
+        Returns:
+            bool: True if safe, False otherwise.
+        """
+        response = await self.POST("are_joint_positions_safe", payload={"joint_positions": joint_positions})
+        return response.get("safe", False)
+
+    async def batch_forward_kinematics(self, *, joint_positions_batch: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Computes forward kinematics for a batch of joint configurations.
+
+        Args:
+            joint_positions_batch (np.ndarray): Joint positions of shape (N, joints).
+
+        Returns:
+            np.ndarray: The end-effector poses, one row per configuration.
+        """
+        response = await self.POST("forward_kinematics_batch", payload={"joint_positions": joint_positions_batch})
+        if not response:
+            return None
+        return np.asarray(response.get("end_effector_pose"), dtype=np.float64).reshape(len(joint_positions_batch), -1)
+
+    async def batch_are_joint_positions_safe(self, *, joint_positions_batch: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Checks a batch of joint configurations for safety in one round-trip.
+
+        Args:
+            joint_positions_batch (np.ndarray): Joint positions of shape (N, joints).
+
+        Returns:
+            np.ndarray: A boolean array, one entry per configuration.
+        """
+        response = await self.POST("are_joint_positions_safe_batch", payload={"joint_positions": joint_positions_batch})
+        if not response:
+            return None
+        return np.asarray(response.get("safe", []), dtype=bool)
+
+    async def send_joint_positions(self, *, joint_positions: np.ndarray, step_count: int) -> None:
+        """
+        Sends joint positions to the robot.
+
+        Args:
+            joint_positions (np.ndarray): The joint positions.
+            step_count (int): The number of steps for the movement.
+        """
+        await self.POST("send_joint_positions", payload={
+            "joint_positions": joint_positions,
+            "step_count": step_count
+        })
+
+    async def command_move(self, *, joint_positions: np.array) -> None:
+        """
+        Commands the robot to move to the specified joint positions.
+
+        Args:
+            joint_positions (np.array): The target joint positions.
+        """
+        await self.POST("command_move", payload={"joint_positions": joint_positions})
+
+    async def command_stop(self) -> None:
+        """
+        Commands the robot to stop its current movement.
+        """
+        await self.POST("command_stop")
+
+    async def aclose(self) -> None:
+        """
+        Disconnects from the robot and closes the underlying HTTP client.
+        """
+        if self._connected:
+            await self.disconnect()
+        # Shared per-loop clients stay open for other instances on the loop;
+        # only an injected client belongs to this instance.
+        if self._client is not None:
+            await self._client.aclose()
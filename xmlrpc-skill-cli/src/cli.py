@@ -1,34 +1,43 @@
 import argparse
-import xmlrpc.client
+import asyncio
 
 from typing import Any, Dict, List
+import httpx
+import orjson
 import requests
 
+from xmlrpc_client import XMLRPCClient
+
 MIRAI_BOX = "172.16.22.56"
 SKILL_API_PORT = 6543
 SKILL_URL = f"http://{MIRAI_BOX}:{SKILL_API_PORT}/skills/"
 
 class HTTPClient:
 
-    @staticmethod
-    def get_box_metadata() -> List[Dict[str, Any]]:
-        r = requests.get(SKILL_URL + "get_box_metadata")
-        return r.json()
+    # One Session shared by all calls so repeated commands reuse the same
+    # TCP connection instead of reconnecting per request.
+    _session = requests.Session()
+    _session.headers.update({"Connection": "keep-alive"})
+
+    @classmethod
+    def get_box_metadata(cls) -> List[Dict[str, Any]]:
+        r = cls._session.get(SKILL_URL + "get_box_metadata")
+        return orjson.loads(r.content)
 
-    @staticmethod
-    def get_trained_skills() -> List[Dict[str, Any]]:
-        r = requests.get(SKILL_URL + "get_trained_skills")
-        return r.json()
+    @classmethod
+    def get_trained_skills(cls) -> List[Dict[str, Any]]:
+        r = cls._session.get(SKILL_URL + "get_trained_skills")
+        return orjson.loads(r.content)
 
-    @staticmethod
-    def prepare_skill_async(skill_id) -> List[Dict[str, Any]]:
-        r = requests.post(SKILL_URL + "prepare_skill_async", json={"skill_id": skill_id})
-        return r.json()
+    @classmethod
+    def prepare_skill_async(cls, skill_id) -> List[Dict[str, Any]]:
+        r = cls._session.post(SKILL_URL + "prepare_skill_async", json={"skill_id": skill_id})
+        return orjson.loads(r.content)
 
-    @staticmethod
-    def execute_skill(skill_id) -> List[Dict[str, Any]]:
-        r = requests.post(SKILL_URL + "execute_skill", json={"skill_id": skill_id})
-        return r.json()
+    @classmethod
+    def execute_skill(cls, skill_id) -> List[Dict[str, Any]]:
+        r = cls._session.post(SKILL_URL + "execute_skill", json={"skill_id": skill_id})
+        return orjson.loads(r.content)
 
     # Example call
 
@@ -60,73 +69,103 @@ class HTTPClient:
 
     #                       distance to the target pose, in degrees
     # after execution of the skill this will return the type of endstate
-    @staticmethod
-    def get_result(skill_id) -> List[Dict[str, Any]]:
-        r = requests.post(SKILL_URL + "get_result", json={"skill_id": skill_id})
-        return r.json()
+    @classmethod
+    def get_result(cls, skill_id) -> List[Dict[str, Any]]:
+        r = cls._session.post(SKILL_URL + "get_result", json={"skill_id": skill_id})
+        return orjson.loads(r.content)
 
 
     # after execution of the skill this will return the last endstate values
-    @staticmethod
-    def get_last_endstate_values(skill_id) -> List[Dict[str, Any]]:
-        r = requests.post(SKILL_URL + "get_last_endstate_values", json={"skill_id": skill_id})
-        return r.json()  
-
-
-class XMLRPCClient:
-    def __init__(self, host):
-        self.server = xmlrpc.client.ServerProxy(f'http://{host}:6543/skills/xmlrpc')
-
-    def get_box_metadata(self):
-        return self.server.get_box_metadata()
-
-    def get_trained_skills(self):
-        return self.server.get_trained_skills()
-
-    def execute_skill(self, skill_id):
-        return self.server.execute_skill(skill_id)
-
-    def get_result(self, skill_id):
-        return self.server.get_result(skill_id)
-
-    def get_last_endstate_values(self, skill_id):
-        return self.server.get_last_endstate_values(skill_id)
+    @classmethod
+    def get_last_endstate_values(cls, skill_id) -> List[Dict[str, Any]]:
+        r = cls._session.post(SKILL_URL + "get_last_endstate_values", json={"skill_id": skill_id})
+        return orjson.loads(r.content)
+
+
+class AsyncHTTPClient:
+
+    # One AsyncClient shared by all calls; HTTP/2 lets a batch of skill
+    # commands multiplex over a single connection.
+    _client = None
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(http2=True)
+        return cls._client
+
+    @classmethod
+    async def get_box_metadata(cls) -> List[Dict[str, Any]]:
+        r = await cls._get_client().get(SKILL_URL + "get_box_metadata")
+        return orjson.loads(r.content)
+
+    @classmethod
+    async def get_trained_skills(cls) -> List[Dict[str, Any]]:
+        r = await cls._get_client().get(SKILL_URL + "get_trained_skills")
+        return orjson.loads(r.content)
+
+    @classmethod
+    async def prepare_skill_async(cls, skill_id) -> List[Dict[str, Any]]:
+        r = await cls._get_client().post(SKILL_URL + "prepare_skill_async", json={"skill_id": skill_id})
+        return orjson.loads(r.content)
+
+    @classmethod
+    async def execute_skill(cls, skill_id) -> List[Dict[str, Any]]:
+        r = await cls._get_client().post(SKILL_URL + "execute_skill", json={"skill_id": skill_id})
+        return orjson.loads(r.content)
+
+    @classmethod
+    async def get_result(cls, skill_id) -> List[Dict[str, Any]]:
+        r = await cls._get_client().post(SKILL_URL + "get_result", json={"skill_id": skill_id})
+        return orjson.loads(r.content)
+
+    @classmethod
+    async def get_last_endstate_values(cls, skill_id) -> List[Dict[str, Any]]:
+        r = await cls._get_client().post(SKILL_URL + "get_last_endstate_values", json={"skill_id": skill_id})
+        return orjson.loads(r.content)
+
+    @classmethod
+    async def aclose(cls) -> None:
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+
+# Maps each command to its client method and whether it requires --skill_id.
+CMDS = {
+    'get_box_metadata': (AsyncHTTPClient.get_box_metadata, False),
+    'get_trained_skills': (AsyncHTTPClient.get_trained_skills, False),
+    'prepare_skill_async': (AsyncHTTPClient.prepare_skill_async, True),
+    'execute_skill': (AsyncHTTPClient.execute_skill, True),
+    'get_result': (AsyncHTTPClient.get_result, True),
+    'get_last_endstate_values': (AsyncHTTPClient.get_last_endstate_values, True),
+}
+
+async def run(args):
+    # client = XMLRPCClient(args.host, SKILL_API_PORT)
+    fn, needs_id = CMDS[args.command]
+
+    try:
+        if needs_id:
+            for result in await asyncio.gather(*(fn(sid) for sid in args.skill_id)):
+                print(result)
+        else:
+            print(await fn())
+    finally:
+        await AsyncHTTPClient.aclose()
 
 def main():
     parser = argparse.ArgumentParser(description='XMLRPC Skill CLI')
     # parser.add_argument('--host', type=str, required=True, help='Host address of the XMLRPC server')
-    parser.add_argument('command', type=str, choices=['get_box_metadata', 'get_trained_skills', 'execute_skill', 'get_result', 'get_last_endstate_values'], help='Command to execute')
-    parser.add_argument('--skill_id', type=int, help='Skill ID for execute_skill, get_result, and get_last_endstate_values commands')
+    parser.add_argument('command', type=str, choices=sorted(CMDS), help='Command to execute')
+    parser.add_argument('--skill_id', type=int, action='append', help='Skill ID for prepare_skill_async, execute_skill, get_result, and get_last_endstate_values commands; repeat to run a batch concurrently')
 
     args = parser.parse_args()
 
-    # client = XMLRPCClient(args.host)
-    client = HTTPClient()
+    if CMDS[args.command][1] and not args.skill_id:
+        parser.error(f"--skill_id is required for the {args.command} command")
 
-    if args.command == 'get_box_metadata':
-        print(client.get_box_metadata())
-    elif args.command == 'get_trained_skills':
-        print(client.get_trained_skills())
-    elif args.command == 'prepare_skill_async':
-        if args.skill_id is None:
-            print("Skill ID is required for prepare_skill_async command.")
-        else:
-            print(client.prepare_skill_async(args.skill_id))
-    elif args.command == 'execute_skill':
-        if args.skill_id is None:
-            print("Skill ID is required for execute_skill command.")
-        else:
-            print(client.execute_skill(args.skill_id))
-    elif args.command == 'get_result':
-        if args.skill_id is None:
-            print("Skill ID is required for get_result command.")
-        else:
-            print(client.get_result(args.skill_id))
-    elif args.command == 'get_last_endstate_values':
-        if args.skill_id is None:
-            print("Skill ID is required for get_last_endstate_values command.")
-        else:
-            print(client.get_last_endstate_values(args.skill_id))
+    asyncio.run(run(args))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
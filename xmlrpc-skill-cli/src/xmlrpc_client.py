@@ -1,14 +1,31 @@
+import struct
+import xmlrpc.client
+
+import msgpack
+import requests
+
+
+def _decode_ext(code, data):
+    # Ext code 1 carries a packed float64 vector (e.g. endstate values),
+    # decoded in one struct.unpack instead of element by element.
+    if code == 1:
+        return list(struct.unpack(f"<{len(data) // 8}d", data))
+    return msgpack.ExtType(code, data)
+
+
 class XMLRPCClient:
     def __init__(self, host, port):
         self.url = f"http://{host}:{port}/skills/xmlrpc"
-    
+        # One proxy for the life of the client. The Transport underneath keeps
+        # its HTTP connection open between calls, so repeated polling reuses
+        # the TCP connection instead of reconnecting per call.
+        self._proxy = xmlrpc.client.ServerProxy(self.url)
+
     def call(self, method_name, params=None):
-        import xmlrpc.client
-        with xmlrpc.client.ServerProxy(self.url) as proxy:
-            if params is None:
-                return getattr(proxy, method_name)()
-            else:
-                return getattr(proxy, method_name)(*params)
+        if params is None:
+            return getattr(self._proxy, method_name)()
+        else:
+            return getattr(self._proxy, method_name)(*params)
 
     def get_box_metadata(self):
         return self.call("get_box_metadata")
@@ -23,4 +40,51 @@ class XMLRPCClient:
         return self.call("get_result", [skill_id])
 
     def get_last_endstate_values(self, skill_id):
-        return self.call("get_last_endstate_values", [skill_id])
\ No newline at end of file
+        return self.call("get_last_endstate_values", [skill_id])
+
+    def close(self):
+        self._proxy("close")()
+
+
+class MsgpackRPCClient:
+    """
+    Binary-codec alternative to XMLRPCClient.
+
+    Speaks a minimal msgpack-RPC over HTTP keep-alive: each call POSTs
+    msgpack.packb({'method': ..., 'params': ...}) to /skills/rpc on a shared
+    requests.Session. For the small numeric vectors the skill API returns,
+    msgpack payloads are roughly an order of magnitude smaller than XML and
+    far cheaper to decode.
+    """
+
+    def __init__(self, host, port):
+        self.url = f"http://{host}:{port}/skills/rpc"
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Connection": "keep-alive",
+            "Content-Type": "application/msgpack",
+        })
+
+    def call(self, method_name, params=None):
+        body = msgpack.packb({"method": method_name, "params": params or []})
+        r = self._session.post(self.url, data=body)
+        r.raise_for_status()
+        return msgpack.unpackb(r.content, raw=False, ext_hook=_decode_ext)
+
+    def get_box_metadata(self):
+        return self.call("get_box_metadata")
+
+    def get_trained_skills(self):
+        return self.call("get_trained_skills")
+
+    def execute_skill(self, skill_id):
+        return self.call("execute_skill", [skill_id])
+
+    def get_result(self, skill_id):
+        return self.call("get_result", [skill_id])
+
+    def get_last_endstate_values(self, skill_id):
+        return self.call("get_last_endstate_values", [skill_id])
+
+    def close(self):
+        self._session.close()